@@ -1,11 +1,44 @@
 import streamlit as st
 from PyPDF2 import PdfReader
-import docx
-from langdetect import detect
+from lxml import etree
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+import orjson
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+import atexit
+import hashlib
+import io
+import os
 import re
-import json
+import queue
+import threading
+import time
+import zipfile
 from datetime import datetime
 
+# ================= PATTERNS =================
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?।])\s+')
+_ENTITY_JUR_RE = re.compile(r'\b(India|Delhi|Mumbai|Bangalore|Chennai)\b', re.I)
+# One alternation scans the document once; group names are the entity buckets.
+# Parties is tried before Jurisdiction so multi-word names win, and
+# jurisdictions inside another match are recovered with _ENTITY_JUR_RE.
+_ENTITY_RE = re.compile(
+    r'(?P<Dates>\b\d{1,2}\s+[A-Za-z]+\s+\d{4}\b)'
+    r'|(?P<Amounts>₹\s?\d+|INR\s?\d+)'
+    r'|(?P<Parties>\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)+\b)'
+    r'|(?P<Jurisdiction>(?i:\b(?:India|Delhi|Mumbai|Bangalore|Chennai)\b))'
+)
+
 # ================= PAGE CONFIG =================
 st.set_page_config(page_title="GenAI Legal Assistant", layout="wide")
 
@@ -32,72 +65,305 @@ uploaded_file = st.file_uploader(
 )
 
 # ================= FILE READER =================
-def read_file(file):
-    if file.name.endswith(".pdf"):
-        reader = PdfReader(file)
+@st.cache_resource(show_spinner=False)
+def get_pdfium_lock():
+    return threading.Lock()
+
+# Streamlit re-executes this script on every rerun, so a plain module-level
+# Lock would be a new object each time; cache_resource makes it process-wide.
+_PDFIUM_LOCK = get_pdfium_lock()
+
+def read_pdf(file_bytes):
+    if pdfium is None:
+        reader = PdfReader(io.BytesIO(file_bytes))
         return "".join(page.extract_text() or "" for page in reader.pages)
-    elif file.name.endswith(".docx"):
-        doc = docx.Document(file)
-        return "\n".join(p.text for p in doc.paragraphs)
-    elif file.name.endswith(".txt"):
-        return file.read().decode("utf-8")
-    return ""
+
+    # PDFium is not thread-safe: no two calls may run at once, even on separate
+    # documents. Streamlit runs each session in its own thread, so the whole
+    # open/read/close sequence holds _PDFIUM_LOCK, and pages are read one by
+    # one rather than in a thread pool.
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(file_bytes)
+        try:
+            parts = []
+            for i in range(len(pdf)):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                parts.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return "".join(parts)
+        finally:
+            pdf.close()
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+# Run-level elements that carry text, with the text they stand for (None means
+# the element's own text), following python-docx's Paragraph.text. w:br is
+# handled separately since only text-wrapping breaks become a newline.
+DOCX_TEXT_TAGS = {
+    W_NS + "t": None,
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-"
+}
+W_BR = W_NS + "br"
+# Only the paragraph's own runs (direct or inside a hyperlink) count, as in
+# python-docx; this skips w:pPr tab stops and text boxes nested in drawings.
+_RUN_CONTENT = etree.XPath(
+    "./w:r/* | ./w:hyperlink/w:r/*",
+    namespaces={"w": W_NS[1:-1]}
+)
+_XML_PARSER = etree.XMLParser(resolve_entities=False)
+
+def read_docx(file_bytes):
+    # Sweep the main document XML directly instead of building python-docx
+    # paragraph and run wrappers for every element.
+    with zipfile.ZipFile(io.BytesIO(file_bytes)) as z:
+        rels = etree.fromstring(z.read("_rels/.rels"), _XML_PARSER)
+        part = next(
+            rel.get("Target").lstrip("/") for rel in rels
+            if rel.get("Type") == OFFICE_DOCUMENT_REL
+        )
+        root = etree.fromstring(z.read(part), _XML_PARSER)
+
+    paragraphs = []
+    for p in root.find(W_NS + "body").iterchildren(W_NS + "p"):
+        parts = []
+        for e in _RUN_CONTENT(p):
+            if e.tag == W_BR:
+                if e.get(W_NS + "type", "textWrapping") == "textWrapping":
+                    parts.append("\n")
+            elif e.tag in DOCX_TEXT_TAGS:
+                text = DOCX_TEXT_TAGS[e.tag]
+                parts.append((e.text or "") if text is None else text)
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+def read_txt(file_bytes):
+    return file_bytes.decode("utf-8")
+
+# Readers take the upload's bytes, read once with getvalue(), so the same
+# buffer doubles as the st.cache_data key.
+FILE_READERS = {
+    ".pdf": read_pdf,
+    ".docx": read_docx,
+    ".txt": read_txt
+}
+
+@st.cache_data(show_spinner=False)
+def read_file(file_bytes, filename):
+    reader = FILE_READERS.get(os.path.splitext(filename)[1].lower())
+    return reader(file_bytes) if reader else ""
+
+LANG_SAMPLE_CHARS = 2048
+# Only the languages the app supports are loaded; the full langdetect profile
+# set keeps n-gram tables for 55 languages resident for the process lifetime.
+LANG_PROFILES = ["en", "hi"]
+
+@st.cache_resource(show_spinner=False)
+def load_language_detector():
+    profiles = []
+    for lang in LANG_PROFILES:
+        with open(os.path.join(PROFILES_DIRECTORY, lang), encoding="utf-8") as f:
+            profiles.append(f.read())
+    factory = DetectorFactory()
+    factory.load_json_profile(profiles)
+    return factory
+
+@st.cache_data(show_spinner=False)
+def detect_language(text):
+    # A few KB from the start and the middle is enough to identify the
+    # language; scanning the whole contract only costs time.
+    if len(text) <= 2 * LANG_SAMPLE_CHARS:
+        sample = text
+    else:
+        mid = len(text) // 2
+        sample = text[:LANG_SAMPLE_CHARS] + " " + text[mid:mid + LANG_SAMPLE_CHARS]
+    if not sample.strip():
+        return "unknown"
+    try:
+        detector = load_language_detector().create()
+        detector.append(sample)
+        return detector.detect()
+    except:
+        return "unknown"
+
+# ================= KEYWORD AUTOMATON =================
+# Every trigger phrase gets one bit; a single Aho-Corasick pass over the
+# lowercased text yields a bitmask of all phrases present.
+KEYWORDS = [
+    "shall not","must not","shall","must","may",
+    "penalty","fine","indemnify","non-compete",
+    "terminate without notice","sole discretion",
+    "arbitration","jurisdiction","auto","renew",
+    "terminate","confidential",
+    "employee","salary","lease","rent","vendor","partner",
+    "वेतन","समाप्त","क्षतिपूर्ति","दंड","मध्यस्थता"
+]
+BIT = {k: 1 << i for i, k in enumerate(KEYWORDS)}
+
+if ahocorasick is not None:
+    AUTOMATON = ahocorasick.Automaton()
+    for k, b in BIT.items():
+        AUTOMATON.add_word(k, b)
+    AUTOMATON.make_automaton()
+else:
+    AUTOMATON = None
+
+# Fallback for deployments where pyahocorasick cannot be installed: one
+# C-level str.find per keyword.
+def find_mask(t):
+    mask = 0
+    for k, b in BIT.items():
+        if t.find(k) >= 0:
+            mask |= b
+    return mask
+
+# Very large texts (e.g. a contract without sentence punctuation, scanned as
+# one clause) go through a Hyperscan DFA when it is installed.
+HYPERSCAN_MIN_CHARS = 100_000
+
+if hyperscan is not None:
+    HS_DATABASE = hyperscan.Database()
+    HS_DATABASE.compile(
+        expressions=[re.escape(k).encode() for k in KEYWORDS],
+        ids=list(range(len(KEYWORDS))),
+        elements=len(KEYWORDS),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(KEYWORDS)
+    )
+    # Scratch space must not be shared between concurrent scans, and each
+    # Streamlit session runs in its own thread.
+    _hs_local = threading.local()
+
+def hyperscan_mask(t):
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(HS_DATABASE)
+    ids = []
+    HS_DATABASE.scan(
+        t.encode("utf-8"),
+        match_event_handler=lambda i, *_: ids.append(i),
+        scratch=scratch
+    )
+    mask = 0
+    for i in ids:
+        mask |= 1 << i
+    return mask
+
+def keyword_mask(t, stop_mask=0):
+    # With stop_mask set, the automaton scan ends as soon as any of its bits
+    # is found; callers only rely on bits they could still need at that point.
+    if hyperscan is not None and len(t) >= HYPERSCAN_MIN_CHARS:
+        return hyperscan_mask(t)
+    if AUTOMATON is None:
+        return find_mask(t)
+    mask = 0
+    for _, b in AUTOMATON.iter(t):
+        mask |= b
+        if mask & stop_mask:
+            break
+    return mask
+
+def any_of(*keywords):
+    mask = 0
+    for k in keywords:
+        mask |= BIT[k]
+    return mask
+
+TRIGGER_MASK = any_of(
+    "shall","must","may","terminate","indemnify","penalty",
+    "arbitration","jurisdiction","renew","confidential",
+    "non-compete","वेतन","समाप्त","क्षतिपूर्ति","दंड","मध्यस्थता"
+)
+
+# Each rule fires if any of its alternatives has all of its bits set; the
+# last field is the mitigation advice shown for that risk, if any.
+RISK_RULES = [
+    ((BIT["penalty"], BIT["fine"]),
+     "Penalty clause may impose financial burden.",
+     None),
+    ((BIT["indemnify"],),
+     "Indemnity clause shifts legal liability.",
+     "Cap indemnity liability to a reasonable amount."),
+    ((BIT["non-compete"],),
+     "Non-compete restricts future work or business.",
+     "Limit non-compete scope and duration."),
+    ((BIT["terminate without notice"], BIT["sole discretion"]),
+     "Unilateral termination favors one party.",
+     "Add mutual notice period for termination."),
+    ((BIT["arbitration"], BIT["jurisdiction"]),
+     "Arbitration or jurisdiction may increase legal cost.",
+     None),
+    ((BIT["auto"] | BIT["renew"],),
+     "Auto-renewal may lock parties into agreement.",
+     "Add opt-out clause before renewal.")
+]
+MITIGATIONS = {risk: advice for _, risk, advice in RISK_RULES if advice}
+
+PROHIBIT_MASK = any_of("shall not", "must not")
+OBLIGATION_MASK = any_of("shall", "must")
+RIGHT_MASK = BIT["may"]
+# Indexed by (prohibition, obligation, right) flags; prohibition wins over
+# obligation, which wins over right ("shall not" also sets the "shall" bit).
+CLAUSE_TYPES = (
+    "General", "Right", "Obligation", "Obligation",
+    "Prohibition", "Prohibition", "Prohibition", "Prohibition"
+)
+
+# Checked in order; the first group present in the document decides its type.
+CONTRACT_TYPE_RULES = [
+    (any_of("employee", "salary"), "Employment Agreement"),
+    (any_of("lease", "rent"), "Lease Agreement"),
+    (BIT["vendor"], "Vendor Contract"),
+    (BIT["partner"], "Partnership Deed")
+]
+
+def has_legal_intent(text):
+    return bool(keyword_mask(text.lower()) & TRIGGER_MASK)
 
 # ================= CLAUSE SPLITTER =================
+@st.cache_data(show_spinner=False)
 def split_into_clauses(text):
-    text = text.replace("\r", " ").replace("\n", " ")
+    # split() already breaks on \r and \n, so this one pass normalises all
+    # whitespace without extra full-document copies.
     text = " ".join(text.split())
-    sentences = re.split(r'(?<=[.!?।])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
-    clauses, buffer = [], ""
-    triggers = [
-        "shall","must","may","terminate","indemnify","penalty",
-        "arbitration","jurisdiction","renew","confidential",
-        "non-compete","वेतन","समाप्त","क्षतिपूर्ति","दंड","मध्यस्थता"
-    ]
+    # Sentences are collected per clause and joined once on flush; growing a
+    # string with += re-copies the whole clause for every sentence.
+    clauses, buffer_parts = [], []
 
     for sent in sentences:
         if len(sent) < 30:
             continue
-        if any(k in sent.lower() for k in triggers):
-            if buffer:
-                clauses.append(buffer.strip())
-            buffer = sent
-        else:
-            buffer += " " + sent
+        if has_legal_intent(sent) and buffer_parts:
+            clauses.append(" ".join(buffer_parts))
+            buffer_parts = []
+        buffer_parts.append(sent)
 
-    if buffer.strip():
-        clauses.append(buffer.strip())
+    if buffer_parts:
+        clauses.append(" ".join(buffer_parts))
 
     return clauses if clauses else [text]
 
 # ================= NLP HELPERS =================
-def classify_clause(text):
-    t = text.lower()
-    if "shall not" in t or "must not" in t:
-        return "Prohibition"
-    elif "shall" in t or "must" in t:
-        return "Obligation"
-    elif "may" in t:
-        return "Right"
-    return "General"
-
-def detect_risks(text):
-    t = text.lower()
-    risks = []
-    if "penalty" in t or "fine" in t:
-        risks.append("Penalty clause may impose financial burden.")
-    if "indemnify" in t:
-        risks.append("Indemnity clause shifts legal liability.")
-    if "non-compete" in t:
-        risks.append("Non-compete restricts future work or business.")
-    if "terminate without notice" in t or "sole discretion" in t:
-        risks.append("Unilateral termination favors one party.")
-    if "arbitration" in t or "jurisdiction" in t:
-        risks.append("Arbitration or jurisdiction may increase legal cost.")
-    if "auto" in t and "renew" in t:
-        risks.append("Auto-renewal may lock parties into agreement.")
-    return risks
+def analyze_clause(clause):
+    mask = keyword_mask(clause.lower())
+    clause_type = CLAUSE_TYPES[
+        (bool(mask & PROHIBIT_MASK) << 2)
+        | (bool(mask & OBLIGATION_MASK) << 1)
+        | bool(mask & RIGHT_MASK)
+    ]
+
+    risks = [
+        risk for alternatives, risk, _ in RISK_RULES
+        if any(mask & m == m for m in alternatives)
+    ]
+    return clause_type, risks, score_clause(risks)
 
 def score_clause(risks):
     if not risks:
@@ -109,47 +375,89 @@ def explain_clause(risks):
         return "This clause appears standard and low risk."
     return "This clause may be risky because: " + " ".join(risks)
 
+AMBIGUOUS_TERMS = [
+    "reasonable","as required","from time to time",
+    "at discretion","as deemed fit","as applicable"
+]
+_AMBIG_RE = re.compile("|".join(map(re.escape, AMBIGUOUS_TERMS)), re.I)
+
 def detect_ambiguity(text):
-    ambiguous = [
-        "reasonable","as required","from time to time",
-        "at discretion","as deemed fit","as applicable"
-    ]
-    return [a for a in ambiguous if a in text.lower()]
+    found = {m.group().lower() for m in _AMBIG_RE.finditer(text)}
+    return [a for a in AMBIGUOUS_TERMS if a in found]
 
 def mitigation_advice(risks):
-    advice = []
-    for r in risks:
-        if "termination" in r.lower():
-            advice.append("Add mutual notice period for termination.")
-        if "non-compete" in r.lower():
-            advice.append("Limit non-compete scope and duration.")
-        if "indemnity" in r.lower():
-            advice.append("Cap indemnity liability to a reasonable amount.")
-        if "auto-renew" in r.lower():
-            advice.append("Add opt-out clause before renewal.")
-    return advice
+    return [MITIGATIONS[r] for r in risks if r in MITIGATIONS]
 
 def extract_entities(text):
-    return {
-        "Dates": re.findall(r'\b\d{1,2}\s+[A-Za-z]+\s+\d{4}\b', text),
-        "Amounts": re.findall(r'₹\s?\d+|INR\s?\d+', text),
-        "Jurisdiction": re.findall(
-            r'\b(India|Delhi|Mumbai|Bangalore|Chennai)\b', text, re.I
-        ),
-        "Parties": re.findall(
-            r'\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)+\b', text
-        )
-    }
+    # Contracts repeat the same names and amounts many times, so matches are
+    # deduplicated as they are found.
+    entities = {"Dates": set(), "Amounts": set(), "Jurisdiction": set(), "Parties": set()}
+    for m in _ENTITY_RE.finditer(text):
+        entities[m.lastgroup].add(m.group())
+        if m.lastgroup != "Jurisdiction":
+            entities["Jurisdiction"].update(_ENTITY_JUR_RE.findall(m.group()))
+    return entities
+
+@st.cache_data(show_spinner=False)
+def detect_contract_type(text):
+    # One scan over the whole document; it can stop at the first
+    # employment keyword since nothing outranks it.
+    mask = keyword_mask(text.lower(), stop_mask=CONTRACT_TYPE_RULES[0][0])
+    for rule_mask, contract_type in CONTRACT_TYPE_RULES:
+        if mask & rule_mask:
+            return contract_type
+    return "Service Contract"
+
+@st.cache_data(show_spinner=False)
+def analyze_document(text):
+    clause_data = []
+    for clause in split_into_clauses(text):
+        clause_type, risks, risk_level = analyze_clause(clause)
+        clause_data.append((clause, clause_type, risks, risk_level))
+    return clause_data, extract_entities(text)
 
 # ================= AUDIT LOG =================
+# Entries are queued by the request path and appended to disk in batches by a
+# background thread, so uploads never wait on file I/O.
+AUDIT_LOG_PATH = "audit_log.json"
+AUDIT_FLUSH_INTERVAL = 1.0
+_audit_write_lock = threading.Lock()
+
+def flush_audit_queue(audit_queue):
+    with _audit_write_lock:
+        entries = []
+        while True:
+            try:
+                entries.append(audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        if entries:
+            with open(AUDIT_LOG_PATH, "ab") as f:
+                f.writelines(orjson.dumps(entry) + b"\n" for entry in entries)
+
+def audit_writer(audit_queue):
+    while True:
+        time.sleep(AUDIT_FLUSH_INTERVAL)
+        flush_audit_queue(audit_queue)
+
+@st.cache_resource(show_spinner=False)
+def get_audit_queue():
+    audit_queue = queue.Queue()
+    threading.Thread(
+        target=audit_writer, args=(audit_queue,), name="audit-writer", daemon=True
+    ).start()
+    # The writer is a daemon thread; write out whatever is still queued on exit.
+    atexit.register(flush_audit_queue, audit_queue)
+    return audit_queue
+
 def log_audit(contract_type, overall_risk):
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        # orjson writes naive datetimes in ISO 8601, like isoformat() did.
+        "timestamp": datetime.now(),
         "contract_type": contract_type,
         "overall_risk": overall_risk
     }
-    with open("audit_log.json", "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    get_audit_queue().put_nowait(entry)
 
 # ================= TEMPLATES =================
 TEMPLATES = {
@@ -161,38 +469,14 @@ TEMPLATES = {
 
 # ================= MAIN LOGIC =================
 if uploaded_file:
-    text = read_file(uploaded_file)
+    file_bytes = uploaded_file.getvalue()
+    file_hash = hashlib.sha256(file_bytes).hexdigest()
+    text = read_file(file_bytes, uploaded_file.name)
+    lang = detect_language(text)
 
-    try:
-        lang = detect(text)
-    except:
-        lang = "unknown"
-
-    t = text.lower()
-    if "employee" in t or "salary" in t:
-        contract_type = "Employment Agreement"
-    elif "lease" in t or "rent" in t:
-        contract_type = "Lease Agreement"
-    elif "vendor" in t:
-        contract_type = "Vendor Contract"
-    elif "partner" in t:
-        contract_type = "Partnership Deed"
-    else:
-        contract_type = "Service Contract"
-
-    clauses = split_into_clauses(text)
-
-    clause_data = []
-    high_risk_count = 0
-
-    for clause in clauses:
-        risks = detect_risks(clause)
-        risk_level = score_clause(risks)
-        if risk_level == "High":
-            high_risk_count += 1
-        clause_data.append(
-            (clause, classify_clause(clause), risks, risk_level)
-        )
+    contract_type = detect_contract_type(text)
+    clause_data, entities = analyze_document(text)
+    high_risk_count = sum(1 for *_, level in clause_data if level == "High")
 
     if high_risk_count >= 3:
         overall_risk = "HIGH RISK"
@@ -201,7 +485,10 @@ if uploaded_file:
     else:
         overall_risk = "LOW RISK"
 
-    log_audit(contract_type, overall_risk)
+    # Selecting clauses reruns the script; only the first run for a file logs.
+    if st.session_state.get("audited_file_hash") != file_hash:
+        log_audit(contract_type, overall_risk)
+        st.session_state["audited_file_hash"] = file_hash
 
     # ---------- OVERVIEW ----------
     st.markdown("## 📄 Contract Overview")
@@ -220,17 +507,42 @@ if uploaded_file:
 
     # ---------- ENTITIES ----------
     st.markdown("## 🏷️ Extracted Entities")
-    for k, v in extract_entities(text).items():
-        st.write(f"**{k}:** {', '.join(set(v)) if v else 'Not found'}")
+    st.markdown("\n\n".join(
+        f"**{k}:** {', '.join(v) if v else 'Not found'}"
+        for k, v in entities.items()
+    ))
 
     # ---------- CLAUSE ANALYSIS ----------
     st.markdown("## 🔍 Clause-by-Clause Analysis")
-    for i, (c, ct, r, s) in enumerate(clause_data, start=1):
-        with st.expander(f"Clause {i}"):
-            st.write(c)
-            st.write(f"**Clause Type:** {ct}")
-            st.write(f"**Risk Level:** {s}")
-            st.write(f"**Explanation:** {explain_clause(r)}")
+    st.caption("Select clauses in the table to see their full analysis.")
+    clause_table = st.dataframe(
+        [
+            {"Clause": i, "Type": ct, "Risk Level": s, "Text": c}
+            for i, (c, ct, _, s) in enumerate(clause_data, start=1)
+        ],
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+        # The widget id does not depend on the table data, so key it by file;
+        # otherwise a selection would carry over to the next upload.
+        key=f"clause_table_{file_hash}"
+    )
+
+    # Explanation, ambiguity and mitigation are only worked out for the
+    # clauses the user selects, not for every clause up front.
+    for row in sorted(clause_table.selection.rows):
+        if row >= len(clause_data):
+            continue
+        c, ct, r, s = clause_data[row]
+        with st.expander(f"Clause {row + 1}", expanded=True):
+            # One markdown element per block keeps the number of front-end
+            # components (and websocket deltas) per clause low.
+            st.markdown(
+                f"{c}\n\n"
+                f"**Clause Type:** {ct}\n\n"
+                f"**Risk Level:** {s}\n\n"
+                f"**Explanation:** {explain_clause(r)}"
+            )
 
             amb = detect_ambiguity(c)
             if amb:
@@ -238,9 +550,10 @@ if uploaded_file:
 
             advice = mitigation_advice(r)
             if advice:
-                st.write("**Suggested Mitigation:**")
-                for a in advice:
-                    st.write(f"- {a}")
+                st.markdown(
+                    "**Suggested Mitigation:**\n\n"
+                    + "\n".join(f"- {a}" for a in advice)
+                )
 
     # ---------- PLAIN-LANGUAGE SUMMARY ----------
     st.markdown("## 🧾 Plain-Language Contract Summary")
@@ -248,7 +561,7 @@ if uploaded_file:
     summary_lines = [
         f"This is a **{contract_type}**.",
         f"The overall legal risk of this contract is **{overall_risk}**.",
-        f"A total of **{len(clauses)} clauses** were analyzed."
+        f"A total of **{len(clause_data)} clauses** were analyzed."
     ]
 
     if high_risk_count > 0:
@@ -260,8 +573,7 @@ if uploaded_file:
             "No high-risk clauses were detected. The contract appears relatively safe."
         )
 
-    for line in summary_lines:
-        st.write("- " + line)
+    st.markdown("\n".join("- " + line for line in summary_lines))
 
     # ---------- TEMPLATE ----------
     st.markdown("## 📑 SME-Friendly Contract Template")